@@ -1,5 +1,4 @@
 import pygame
-import numpy as np
 from simulation import Map, Food, Colony, render_pheromones, draw_food
 
 pygame.init()
@@ -11,13 +10,27 @@ CELL_SIZE = 4
 GRID_WIDTH = WIDTH // CELL_SIZE
 GRID_HEIGHT = HEIGHT // CELL_SIZE
 
-DIRT_COLOR = (160, 82, 45)
 WHITE = (255, 255, 255)
 
 screen = pygame.display.set_mode((WIDTH, HEIGHT))
 pygame.display.set_caption("Ant Colony Simulator - Modular Version")
 font = pygame.font.SysFont("Arial", 20)
 
+# HUD strings repeat across frames, so cache the rasterized surfaces by
+# text; rendering is a costly FreeType pass per call.
+_hud_cache = {}
+
+
+def render_cached(text):
+    surface = _hud_cache.get(text)
+    if surface is None:
+        if len(_hud_cache) >= 256:
+            # Evict the oldest entry; dicts keep insertion order.
+            _hud_cache.pop(next(iter(_hud_cache)))
+        surface = font.render(text, True, WHITE)
+        _hud_cache[text] = surface
+    return surface
+
 
 def main():
     dt = 0.45  # Initial time step.
@@ -56,7 +69,8 @@ def main():
                 elif event.key == pygame.K_DOWN:
                     dt /= 1.1
 
-        screen.fill(DIRT_COLOR)
+        # The opaque pheromone surface encodes the dirt background, so no
+        # full-screen fill is needed before it.
         render_pheromones(screen, pher_home, pher_food, CELL_SIZE)
         draw_food(screen, food, CELL_SIZE)
         colony.update(food, dt)
@@ -64,17 +78,15 @@ def main():
         colony.draw(screen)
 
         # Display simulation statistics.
-        delivered_text = font.render(
-            f"Food Delivered: {colony.food_delivered}", True, WHITE
-        )
-        time_text = font.render(f"Time Elapsed: {sim_time:.2f}", True, WHITE)
-        dt_text = font.render(f"dt: {dt:.3f}", True, WHITE)
+        delivered_text = render_cached(f"Food Delivered: {colony.food_delivered}")
+        time_text = render_cached(f"Time Elapsed: {sim_time:.2f}")
+        dt_text = render_cached(f"dt: {dt:.3f}")
         screen.blit(delivered_text, (10, 10))
         screen.blit(time_text, (10, 30))
         screen.blit(dt_text, (10, 50))
 
         # Check if all food is delivered and no ant carries food.
-        if np.sum(food.map_vals) == 0 and all(not ant.has_food for ant in colony.ants):
+        if food.count == 0 and colony.ants_with_food == 0:
             if not delivered_printed:
                 print(f"Total Food Delivered: {colony.food_delivered}")
                 print(f"Total Time Elapsed: {sim_time:.2f} seconds")
@@ -1,33 +1,91 @@
-import math
-import time
-
-
-class ManualRNG:
-    def __init__(self, seed=None):
-        # If no seed is provided, generate one using the current system time.
-        if seed is None:
-            seed = int(time.time() * 1000) % 2147483647
-        self.m = 2147483647  # modulus (a large prime)
-        self.a = 16807  # multiplier
-        self.c = 0  # increment
-        self.state = seed
-
-    def random(self):
-        # Returns a pseudo-random float in the range [0, 1)
-        self.state = (self.a * self.state + self.c) % self.m
-        return self.state / self.m
-
-    def uniform(self, a, b):
-        # Returns a pseudo-random float in the range [a, b)
-        return a + (b - a) * self.random()
-
-    def randint(self, a, b):
-        # Returns a pseudo-random integer in the range [a, b]
-        return a + int(self.random() * (b - a + 1))
-
-    def normal(self, mean=0, std=1):
-        # Generate a normally distributed random number using the Box-Muller transform.
-        u1 = self.random()
-        u2 = self.random()
-        z0 = math.sqrt(-2.0 * math.log(u1)) * math.cos(2 * math.pi * u2)
-        return mean + std * z0
+import math
+import time
+
+import numpy as np
+
+
+class ManualRNG:
+    def __init__(self, seed=None):
+        # If no seed is provided, generate one using the current system time.
+        if seed is None:
+            seed = int(time.time() * 1000) % 2147483647
+        self.m = 2147483647  # modulus (a large prime)
+        self.a = 16807  # multiplier
+        self.c = 0  # increment
+        self.state = seed
+        self._powers = None  # Table of a^i mod m for batched generation.
+        self._buffer = None  # Prefilled uniforms consumed by random().
+        self._cursor = 0
+        self._spare = None  # Second Box-Muller normal saved for the next call.
+
+    def _multiplier_powers(self, n):
+        # Returns [a^1, a^2, ..., a^n] mod m, grown lazily and cached.
+        if self._powers is None or self._powers.shape[0] < n:
+            powers = np.empty(n, dtype=np.uint64)
+            p = 1
+            for i in range(n):
+                p = (p * self.a) % self.m
+                powers[i] = p
+            self._powers = powers
+        return self._powers[:n]
+
+    def random_array(self, n):
+        # Returns n pseudo-random floats in [0, 1) in one vectorized step.
+        # The state after i steps is (a^i * state) mod m, so multiplying the
+        # current state into the cached power table yields the whole batch;
+        # every product stays below 2^62 and fits in uint64.
+        states = (self._multiplier_powers(n) * np.uint64(self.state)) % np.uint64(
+            self.m
+        )
+        self.state = int(states[-1])
+        return states / self.m
+
+    def uniform_array(self, a, b, n):
+        # Returns n pseudo-random floats in the range [a, b)
+        return a + (b - a) * self.random_array(n)
+
+    def normal_array(self, n, mean=0, std=1):
+        # Vectorized Box-Muller; each pair of uniforms yields two independent
+        # normals, so generate ceil(n/2) pairs and trim.
+        pairs = (n + 1) // 2
+        u1 = self.random_array(pairs)
+        u2 = self.random_array(pairs)
+        r = np.sqrt(-2.0 * np.log(u1))
+        theta = 2 * math.pi * u2
+        z = np.concatenate((r * np.cos(theta), r * np.sin(theta)))[:n]
+        return mean + std * z
+
+    def random(self):
+        # Returns a pseudo-random float in the range [0, 1).
+        # Scalar draws pull from a prefilled batch; the sequence is the same
+        # as stepping the recurrence one call at a time.
+        if self._buffer is None or self._cursor >= self._buffer.shape[0]:
+            self._buffer = self.random_array(1024)
+            self._cursor = 0
+        val = self._buffer[self._cursor]
+        self._cursor += 1
+        return float(val)
+
+    def uniform(self, a, b):
+        # Returns a pseudo-random float in the range [a, b)
+        return a + (b - a) * self.random()
+
+    def randint(self, a, b):
+        # Returns a pseudo-random integer in the range [a, b]
+        return a + int(self.random() * (b - a + 1))
+
+    def normal(self, mean=0, std=1):
+        # Generate a normally distributed random number using the Box-Muller
+        # transform. Each uniform pair yields two independent normals, so the
+        # second is kept as a spare and returned by the next call.
+        if self._spare is not None:
+            z0 = self._spare
+            self._spare = None
+            return mean + std * z0
+        u1 = self.random()
+        u2 = self.random()
+        r = math.sqrt(-2.0 * math.log(u1))
+        theta = 2 * math.pi * u2
+        z0 = r * math.cos(theta)
+        self._spare = r * math.sin(theta)
+        return mean + std * z0
@@ -1,11 +1,204 @@
 import pygame
 import numpy as np
-from scipy.integrate import ode
 import math
+from numba import njit
 from rng import ManualRNG
 
 rng = ManualRNG()
 
+# Neighbor offsets for pheromone sampling, precomputed once so the numba
+# kernel receives a plain int32 array instead of rebuilding a list per call.
+_OFFSETS = np.array(
+    [(-1, -1), (0, -1), (1, -1), (-1, 0), (1, 0), (-1, 1), (0, 1), (1, 1)],
+    dtype=np.int32,
+)
+
+
+# The kernels carry explicit signatures so they compile eagerly at import
+# (amortized by cache=True across runs) instead of stalling the first
+# frame; fastmath is safe since the physics never produces NaN/inf, and
+# index arithmetic is bounds-checked by hand where it matters.
+@njit('float64(uint64[:])', cache=True, fastmath=True, boundscheck=False)
+def _lcg_random(state):
+    # Same generator as ManualRNG (multiplicative LCG mod 2^31 - 1) so the
+    # kernel stays in nopython mode without calling back into Python.
+    state[0] = (16807 * state[0]) % 2147483647
+    return state[0] / 2147483647
+
+
+@njit(
+    'UniTuple(float64, 2)(uint8[:,:], int64, int64, int32[:,:])',
+    cache=True,
+    fastmath=True,
+    boundscheck=False,
+)
+def weighted_dir(map_vals, gx, gy, offsets):
+    # Weighted average direction toward the 8 neighbors of grid cell
+    # (gx, gy); bounds-checked so edge cells just see fewer neighbors.
+    height, width = map_vals.shape
+    sum_dx = 0.0
+    sum_dy = 0.0
+    total = 0.0
+    for k in range(offsets.shape[0]):
+        nx = gx + offsets[k, 0]
+        ny = gy + offsets[k, 1]
+        if 0 <= nx < width and 0 <= ny < height:
+            value = map_vals[ny, nx]
+            sum_dx += offsets[k, 0] * value
+            sum_dy += offsets[k, 1] * value
+            total += value
+    if total > 0:
+        return sum_dx / total, sum_dy / total
+    return 0.0, 0.0
+
+
+@njit(
+    'void(float32[:], float32[:], float32[:], float32[:], uint8[:], int32[:], '
+    'float32[:], float32[:], uint8[:,:], uint8[:,:], float64, float64, '
+    'int32[:,:], float64, float64, int32[:], int32[:], uint64[:])',
+    cache=True,
+    fastmath=True,
+    boundscheck=False,
+)
+def step_ants(
+    x,
+    y,
+    dx,
+    dy,
+    has_food,
+    bored,
+    home_pher,
+    food_pher,
+    home_map,
+    food_map,
+    home_scale,
+    food_scale,
+    offsets,
+    dt,
+    use_rate,
+    last_ix,
+    last_iy,
+    rng_state,
+):
+    # Per-ant update over structure-of-arrays data; ants are processed in
+    # order so deposits are visible to later ants within the same frame,
+    # matching the original sequential Ant.step loop. Wander noise and
+    # boredom triggers are applied as vectorized masks by the caller.
+    # Deposits are quantized with each map's scale; steering reads raw
+    # values since the scale cancels out of the weighted average.
+    height, width = home_map.shape
+    for i in range(x.shape[0]):
+        if bored[i] > 0:
+            bored[i] -= 1
+        else:
+            if has_food[i]:
+                target = home_map
+            else:
+                target = food_map
+            gx = int(x[i]) // 4
+            gy = int(y[i]) // 4
+            wdx, wdy = weighted_dir(target, gx, gy, offsets)
+            ux = _lcg_random(rng_state) * 1.5  # uniform(0, 1.5)
+            uy = _lcg_random(rng_state) * 1.5
+            dx[i] += wdx * ux * dt
+            dy[i] += wdy * uy * dt
+
+        # Boundary conditions.
+        if x[i] < 2:
+            dx[i] = 1
+        if x[i] > 600 - 2:
+            dx[i] = -1
+        if y[i] < 2:
+            dy[i] = 1
+        if y[i] > 400 - 2:
+            dy[i] = -1
+
+        dx[i] = max(min(dx[i], 1), -1)
+        dy[i] = max(min(dy[i], 1), -1)
+
+        # Update position.
+        x[i] += dx[i] * dt
+        y[i] += dy[i] * dt
+        int_x = int(x[i])
+        int_y = int(y[i])
+
+        # Deposit pheromones if cell changed.
+        if last_ix[i] != int_x or last_iy[i] != int_y:
+            gx = int_x // 4
+            gy = int_y // 4
+            if has_food[i]:
+                food_pher[i] *= use_rate
+                if 0 <= gx < width and 0 <= gy < height:
+                    scaled = min(255, int(food_pher[i] * food_scale))
+                    if scaled > food_map[gy, gx]:
+                        food_map[gy, gx] = scaled
+            else:
+                home_pher[i] *= use_rate
+                if 0 <= gx < width and 0 <= gy < height:
+                    scaled = min(255, int(home_pher[i] * home_scale))
+                    if scaled > home_map[gy, gx]:
+                        home_map[gy, gx] = scaled
+        last_ix[i] = int_x
+        last_iy[i] = int_y
+
+
+@njit(
+    'UniTuple(int32[:], 2)(float32[:], float32[:])',
+    cache=True,
+    fastmath=True,
+    boundscheck=False,
+)
+def collect_collision_pairs(x, y):
+    # Broad phase: bucket ants into a uniform grid with cells the size of
+    # the collision distance, so each ant only tests the 3x3 neighborhood
+    # of its bucket instead of every other ant (O(N) vs O(N^2) pairs).
+    # Emits the candidate (i, j) index pairs; the caller resolves them
+    # vectorially.
+    ncx = 600 // 8 + 1
+    ncy = 400 // 8 + 1
+    n = x.shape[0]
+    cell_ids = np.empty(n, dtype=np.int32)
+    counts = np.zeros(ncx * ncy + 1, dtype=np.int32)
+    for i in range(n):
+        cx = min(max(int(x[i]) // 8, 0), ncx - 1)
+        cy = min(max(int(y[i]) // 8, 0), ncy - 1)
+        cell_ids[i] = cx * ncy + cy
+        counts[cell_ids[i] + 1] += 1
+    for c in range(1, counts.shape[0]):
+        counts[c] += counts[c - 1]
+    # Counting sort: order holds ant indices grouped by bucket, with
+    # bucket c occupying order[counts[c]:counts[c + 1]].
+    order = np.empty(n, dtype=np.int32)
+    cursor = counts[:-1].copy()
+    for i in range(n):
+        order[cursor[cell_ids[i]]] = i
+        cursor[cell_ids[i]] += 1
+    # Worst case every ant shares one bucket; n is small enough that
+    # preallocating the full pair count is cheap.
+    pair_i = np.empty(n * (n - 1) // 2, dtype=np.int32)
+    pair_j = np.empty(n * (n - 1) // 2, dtype=np.int32)
+    pair_count = 0
+    for i in range(n):
+        cx = cell_ids[i] // ncy
+        cy = cell_ids[i] % ncy
+        for ox in range(-1, 2):
+            bx = cx + ox
+            if bx < 0 or bx >= ncx:
+                continue
+            for oy in range(-1, 2):
+                by = cy + oy
+                if by < 0 or by >= ncy:
+                    continue
+                c = bx * ncy + by
+                for s in range(counts[c], counts[c + 1]):
+                    j = order[s]
+                    # j > i keeps each pair emitted exactly once.
+                    if j > i:
+                        pair_i[pair_count] = i
+                        pair_j[pair_count] = j
+                        pair_count += 1
+    return pair_i[:pair_count], pair_j[:pair_count]
+
 
 class Map:
     def __init__(self, grid_width, grid_height, max_val=100, evaporation_rate=0.999):
@@ -13,65 +206,47 @@ class Map:
         self.height = grid_height
         self.max_val = max_val  # Maximum pheromone value for normalization
         self.evaporation_rate = evaporation_rate  # Determines decay per time unit
-        self.map_vals = np.zeros((self.height, self.width), dtype=np.float32)
+        self._k = -math.log(evaporation_rate)  # Decay constant, cached
+        # Pheromone values only feed directional weighting and alpha
+        # blending, so 8 bits of range suffice; uint8 storage quarters the
+        # memory traffic of the decay sweep and the render blend.
+        self.scale = 255.0 / max_val  # Quantization scale for stored values
+        self.map_vals = np.zeros((self.height, self.width), dtype=np.uint8)
+        self._factor_dt = None  # Single-entry cache of the 8.8 decay factor
+        self._factor_q = 256
 
     def step(self, dt):
-        # Update the pheromone map over a time step dt using an ODE solver.
-        # The decay is modeled as: dP/dt = -k * P, with k = -ln(evaporation_rate)
-        k = -np.log(self.evaporation_rate)
-        y0 = self.map_vals.flatten()  # Flatten to 1D
-
-        def dP_dt(t, y):
-            return -k * y
-
-        solver = ode(dP_dt)
-        solver.set_integrator("dop853")
-        solver.set_initial_value(y0, 0)
-        solver.integrate(dt)
-        self.map_vals = solver.y.reshape(self.map_vals.shape)
+        # Advance the decay dP/dt = -k * P, with k = -ln(evaporation_rate),
+        # as a fixed-point 8.8 multiply on the quantized grid.
+        if dt != self._factor_dt:
+            self._factor_dt = dt
+            self._factor_q = int(math.exp(-self._k * dt) * 256)
+        if self._factor_q < 256:
+            self.map_vals = (
+                (self.map_vals.astype(np.uint16) * self._factor_q) >> 8
+            ).astype(np.uint8)
 
     def set_value(self, x, y, val):
         gx = x // 4
         gy = y // 4
         if 0 <= gx < self.width and 0 <= gy < self.height:
-            if val > self.map_vals[gy, gx]:
-                self.map_vals[gy, gx] = val
+            scaled = min(255, int(val * self.scale))
+            if scaled > self.map_vals[gy, gx]:
+                self.map_vals[gy, gx] = scaled
 
     def get_value(self, x, y):
         gx = x // 4
         gy = y // 4
         if 0 <= gx < self.width and 0 <= gy < self.height:
-            return self.map_vals[gy, gx]
+            return self.map_vals[gy, gx] / self.scale
         return -1
 
     def get_weighted_direction(self, x, y):
-        gx = x // 4
-        gy = y // 4
-        sum_dx = 0.0
-        sum_dy = 0.0
-        total = 0.0
-        directions = [
-            (-1, -1),
-            (0, -1),
-            (1, -1),
-            (-1, 0),
-            (1, 0),
-            (-1, 1),
-            (0, 1),
-            (1, 1),
-        ]
-        for dx, dy in directions:
-            nx = gx + dx
-            ny = gy + dy
-            if 0 <= nx < self.width and 0 <= ny < self.height:
-                value = self.map_vals[ny, nx]
-                sum_dx += dx * value
-                sum_dy += dy * value
-                total += value
-        if total > 0:
-            return [sum_dx / total, sum_dy / total]
-        else:
-            return [0, 0]
+        # Thin wrapper over the compiled kernel helper. The quantization
+        # scale cancels out of the weighted average, so raw stored values
+        # can be used directly.
+        wdx, wdy = weighted_dir(self.map_vals, x // 4, y // 4, _OFFSETS)
+        return [wdx, wdy]
 
 
 class Food:
@@ -80,20 +255,32 @@ class Food:
         self.height = grid_height
         # Boolean grid: True indicates food presence.
         self.map_vals = np.zeros((self.height, self.width), dtype=bool)
+        # Number of True cells, kept incrementally so callers never need a
+        # full-grid reduction.
+        self.count = 0
+        # Cached render surface, rebuilt by draw_food only when dirty.
+        self.surface = None
+        self.dirty = True
 
     def add_food(self, x, y):
         gx = x // 4
         gy = y // 4
-        # Add food in a 5x5 block.
-        for i in range(gy, min(gy + 5, self.height)):
-            for j in range(gx, min(gx + 5, self.width)):
-                self.map_vals[i, j] = True
+        # Add food in a 5x5 block (slice assignment clips at the edges).
+        block = self.map_vals[
+            gy : min(gy + 5, self.height), gx : min(gx + 5, self.width)
+        ]
+        self.count += int(block.size - np.count_nonzero(block))
+        block[:] = True
+        self.dirty = True
 
     def bite(self, x, y):
         gx = x // 4
         gy = y // 4
         if 0 <= gx < self.width and 0 <= gy < self.height:
+            if self.map_vals[gy, gx]:
+                self.count -= 1
             self.map_vals[gy, gx] = False
+            self.dirty = True
 
     def get_value(self, x, y):
         gx = x // 4
@@ -103,182 +290,207 @@ class Food:
         return False
 
 
-class Ant:
-    def __init__(self, x, y, home_map, food_map):
-        # Initialize velocity with Gaussian noise.
-        self.dx = rng.normal(0, 1)
-        self.dy = rng.normal(0, 1)
-        self.x = float(x)
-        self.y = float(y)
-        self.int_x = x
-        self.int_y = y
-        self.last_x = x
-        self.last_y = y
-        self.has_food = False
-        self.home_pher = 100
-        self.food_pher = 100
-        self.use_rate = 0.995
-        self.wander_chance = 0.92
-        self.bored = 0
-        self.home_map = home_map
-        self.food_map = food_map
-
-    def step(self, dt):
-        # Use Gaussian noise to update velocity.
-        if rng.random() > self.wander_chance:
-            self.dx += rng.normal(0, 1) * dt
-        if rng.random() > self.wander_chance:
-            self.dy += rng.normal(0, 1) * dt
-        if rng.random() > 0.99:
-            self.bored += rng.randint(0, 15)
-        if self.bored > 0:
-            self.bored -= 1
-        else:
-            if self.has_food:
-                direction = self.home_map.get_weighted_direction(self.int_x, self.int_y)
-                self.dx += direction[0] * rng.uniform(0, 1.5) * dt
-                self.dy += direction[1] * rng.uniform(0, 1.5) * dt
-            else:
-                direction = self.food_map.get_weighted_direction(self.int_x, self.int_y)
-                self.dx += direction[0] * rng.uniform(0, 1.5) * dt
-                self.dy += direction[1] * rng.uniform(0, 1.5) * dt
-
-        # Boundary conditions.
-        if self.x < 2:
-            self.dx = 1
-        if self.x > 600 - 2:
-            self.dx = -1
-        if self.y < 2:
-            self.dy = 1
-        if self.y > 400 - 2:
-            self.dy = -1
-
-        self.dx = max(min(self.dx, 1), -1)
-        self.dy = max(min(self.dy, 1), -1)
-
-        # Update position.
-        self.x += self.dx * dt
-        self.y += self.dy * dt
-        self.int_x = int(self.x)
-        self.int_y = int(self.y)
-
-        # Deposit pheromones if cell changed.
-        if self.last_x != self.int_x or self.last_y != self.int_y:
-            if self.has_food:
-                self.food_pher *= self.use_rate
-                self.food_map.set_value(self.int_x, self.int_y, self.food_pher)
-            else:
-                self.home_pher *= self.use_rate
-                self.home_map.set_value(self.int_x, self.int_y, self.home_pher)
-        self.last_x = self.int_x
-        self.last_y = self.int_y
-
-
 class Colony:
     def __init__(self, x, y, count, home_map, food_map):
-        self.ants = [Ant(x, y, home_map, food_map) for _ in range(count)]
         self.x = x
         self.y = y
+        self.count = count
         self.food_delivered = 0
+        self.ants_with_food = 0
+        self.home_map = home_map
+        self.food_map = food_map
+        self.use_rate = 0.995
+        self.wander_chance = 0.92
+        # Authoritative ant state as structure-of-arrays; one batched draw
+        # covers every ant's initial velocity.
+        velocities = rng.normal_array(2 * count)
+        self.ant_x = np.full(count, x, dtype=np.float32)
+        self.ant_y = np.full(count, y, dtype=np.float32)
+        self.ant_dx = velocities[0::2].astype(np.float32)
+        self.ant_dy = velocities[1::2].astype(np.float32)
+        self.ant_has_food = np.zeros(count, dtype=np.uint8)
+        self.ant_bored = np.zeros(count, dtype=np.int32)
+        self.ant_home_pher = np.full(count, 100, dtype=np.float32)
+        self.ant_food_pher = np.full(count, 100, dtype=np.float32)
+        self.ant_last_ix = np.full(count, x, dtype=np.int32)
+        self.ant_last_iy = np.full(count, y, dtype=np.int32)
+        # Dedicated LCG state for the kernel, seeded from the module RNG.
+        self._rng_state = np.array([rng.randint(1, 2147483646)], dtype=np.uint64)
+        # Pre-rendered ant sprites keyed by (has_food, horizontal) so draw
+        # can batch every ant into a single blits() call.
+        self.ant_sprites = {}
+        for has_food, color in ((False, (50, 30, 20)), (True, (218, 165, 32))):
+            for horizontal, size in ((True, (6, 4)), (False, (4, 6))):
+                sprite = pygame.Surface(size)
+                sprite.fill(color)
+                self.ant_sprites[(has_food, horizontal)] = sprite
 
     def update(self, food, dt):
-        for ant in self.ants:
-            ant.step(dt)
-            # If ant with food reaches nest region (within 20 pixels)
-            if ant.has_food:
-                if abs(ant.int_x - self.x) < 20 and abs(ant.int_y - self.y) < 20:
-                    ant.has_food = False
-                    ant.home_pher = 100
-                    self.food_delivered += 1
-            else:
-                if food.get_value(ant.int_x, ant.int_y):
-                    ant.has_food = True
-                    ant.food_pher = 100
-                    food.bite(ant.int_x, ant.int_y)
+        # Wander noise and boredom triggers as branchless masks over the
+        # whole colony: one batched draw replaces three scalar draws and
+        # three branches per ant.
+        n = self.count
+        u = rng.random_array(3 * n).reshape(3, n)
+        noise = rng.normal_array(2 * n).reshape(2, n)
+        self.ant_dx += np.where(u[0] > self.wander_chance, noise[0] * dt, 0).astype(
+            np.float32
+        )
+        self.ant_dy += np.where(u[1] > self.wander_chance, noise[1] * dt, 0).astype(
+            np.float32
+        )
+        boredom = (rng.random_array(n) * 16).astype(np.int32)
+        self.ant_bored += np.where(u[2] > 0.99, boredom, 0)
+        step_ants(
+            self.ant_x,
+            self.ant_y,
+            self.ant_dx,
+            self.ant_dy,
+            self.ant_has_food,
+            self.ant_bored,
+            self.ant_home_pher,
+            self.ant_food_pher,
+            self.home_map.map_vals,
+            self.food_map.map_vals,
+            self.home_map.scale,
+            self.food_map.scale,
+            _OFFSETS,
+            dt,
+            self.use_rate,
+            self.ant_last_ix,
+            self.ant_last_iy,
+            self._rng_state,
+        )
+        # Ants with food that reached the nest region (within 20 pixels).
+        at_nest = (
+            (self.ant_has_food == 1)
+            & (np.abs(self.ant_last_ix - self.x) < 20)
+            & (np.abs(self.ant_last_iy - self.y) < 20)
+        )
+        delivered = int(np.count_nonzero(at_nest))
+        if delivered:
+            self.ant_has_food[at_nest] = 0
+            self.ant_home_pher[at_nest] = 100
+            self.food_delivered += delivered
+            self.ants_with_food -= delivered
+        # Food pickup: the mask narrows the loop to ants actually standing
+        # on food; the per-ant bite stays sequential so two ants on one
+        # cell cannot both take the last bite.
+        gx = self.ant_last_ix // 4
+        gy = self.ant_last_iy // 4
+        in_grid = (gx >= 0) & (gx < food.width) & (gy >= 0) & (gy < food.height)
+        on_food = np.zeros(n, dtype=bool)
+        on_food[in_grid] = food.map_vals[gy[in_grid], gx[in_grid]]
+        for i in np.flatnonzero((self.ant_has_food == 0) & on_food):
+            ix = int(self.ant_last_ix[i])
+            iy = int(self.ant_last_iy[i])
+            if food.get_value(ix, iy):
+                self.ant_has_food[i] = 1
+                self.ant_food_pher[i] = 100
+                self.ants_with_food += 1
+                food.bite(ix, iy)
 
     def resolve_collisions(self):
         # Check pairwise collisions; ants are circles with radius 4.
         collision_distance = 8
-        n = len(self.ants)
-        for i in range(n):
-            for j in range(i + 1, n):
-                ant1 = self.ants[i]
-                ant2 = self.ants[j]
-                dx = ant1.x - ant2.x
-                dy = ant1.y - ant2.y
-                dist = math.hypot(dx, dy)
-                if dist < collision_distance:
-                    if dist == 0:
-                        angle = rng.uniform(0, 2 * math.pi)
-                        normal = [math.cos(angle), math.sin(angle)]
-                        dist = 0.1
-                    else:
-                        normal = [dx / dist, dy / dist]
-                    penetration = collision_distance - dist
-                    correction = 0.5 * penetration
-                    ant1.x += correction * normal[0]
-                    ant1.y += correction * normal[1]
-                    ant2.x -= correction * normal[0]
-                    ant2.y -= correction * normal[1]
-                    rel_vx = ant1.dx - ant2.dx
-                    rel_vy = ant1.dy - ant2.dy
-                    rel_dot = rel_vx * normal[0] + rel_vy * normal[1]
-                    if rel_dot < 0:
-                        e = 0.5  # Coefficient of restitution
-                        impulse = -(1 + e) * rel_dot / 2  # Equal mass assumption
-                        ant1.dx += impulse * normal[0]
-                        ant1.dy += impulse * normal[1]
-                        ant2.dx -= impulse * normal[0]
-                        ant2.dy -= impulse * normal[1]
+        i_idx, j_idx = collect_collision_pairs(self.ant_x, self.ant_y)
+        pair_dx = self.ant_x[i_idx] - self.ant_x[j_idx]
+        pair_dy = self.ant_y[i_idx] - self.ant_y[j_idx]
+        d2 = pair_dx * pair_dx + pair_dy * pair_dy
+        hit = d2 < collision_distance * collision_distance
+        if np.any(hit):
+            i_idx = i_idx[hit]
+            j_idx = j_idx[hit]
+            pair_dx = pair_dx[hit]
+            pair_dy = pair_dy[hit]
+            dist = np.sqrt(d2[hit])
+            # Coincident ants separate along a random direction; giving the
+            # pair a fake 0.1 px offset reproduces the old scalar behavior.
+            zero = dist == 0
+            if np.any(zero):
+                angle = rng.uniform_array(0, 2 * math.pi, int(zero.sum()))
+                dist[zero] = 0.1
+                pair_dx[zero] = np.cos(angle) * 0.1
+                pair_dy[zero] = np.sin(angle) * 0.1
+            normal_x = pair_dx / dist
+            normal_y = pair_dy / dist
+            correction = 0.5 * (collision_distance - dist)
+            # np.add.at handles ants that appear in several pairs.
+            np.add.at(self.ant_x, i_idx, correction * normal_x)
+            np.add.at(self.ant_y, i_idx, correction * normal_y)
+            np.add.at(self.ant_x, j_idx, -correction * normal_x)
+            np.add.at(self.ant_y, j_idx, -correction * normal_y)
+            rel_vx = self.ant_dx[i_idx] - self.ant_dx[j_idx]
+            rel_vy = self.ant_dy[i_idx] - self.ant_dy[j_idx]
+            rel_dot = rel_vx * normal_x + rel_vy * normal_y
+            e = 0.5  # Coefficient of restitution
+            # Equal mass assumption; pairs moving apart get zero impulse.
+            impulse = np.where(rel_dot < 0, -(1 + e) * rel_dot / 2, 0.0)
+            np.add.at(self.ant_dx, i_idx, impulse * normal_x)
+            np.add.at(self.ant_dy, i_idx, impulse * normal_y)
+            np.add.at(self.ant_dx, j_idx, -impulse * normal_x)
+            np.add.at(self.ant_dy, j_idx, -impulse * normal_y)
 
     def draw(self, surface):
-        for ant in self.ants:
-            color = (218, 165, 32) if ant.has_food else (50, 30, 20)
-            if abs(ant.dx) > abs(ant.dy):
-                pygame.draw.rect(surface, color, (int(ant.x), int(ant.y), 6, 4))
-            else:
-                pygame.draw.rect(surface, color, (int(ant.x), int(ant.y), 4, 6))
+        # Submit every ant in one blits() batch instead of a draw.rect per
+        # ant; the four sprite variants are shared across the colony.
+        horizontal = np.abs(self.ant_dx) > np.abs(self.ant_dy)
+        blit_sequence = [
+            (
+                self.ant_sprites[(bool(self.ant_has_food[i]), bool(horizontal[i]))],
+                (int(self.ant_x[i]), int(self.ant_y[i])),
+            )
+            for i in range(self.count)
+        ]
+        surface.blits(blit_sequence, doreturn=False)
+
+
+# Persistent target surface for render_pheromones, created on first use.
+_pheromone_surface = None
 
 
 def render_pheromones(surface, home_map, food_map, cell_size=4):
-    pheromone_surface = pygame.Surface(
-        (surface.get_width(), surface.get_height()), pygame.SRCALPHA
-    )
-    for gy in range(home_map.height):
-        for gx in range(home_map.width):
-            x_pixel = gx * cell_size
-            y_pixel = gy * cell_size
-            home_val = home_map.map_vals[gy, gx]
-            food_val = food_map.map_vals[gy, gx]
-            if home_val > 0 or food_val > 0:
-                home_alpha = (home_val / home_map.max_val) * 255
-                food_alpha = (food_val / home_map.max_val) * 255
-                pixel_r = int(80 * (home_alpha / 255) + 160 * (1 - home_alpha / 255))
-                pixel_g = int(70 * (home_alpha / 255) + 82 * (1 - home_alpha / 255))
-                pixel_b = int(60 * (home_alpha / 255) + 45 * (1 - home_alpha / 255))
-                pixel_r = int(
-                    255 * (food_alpha / 255) + pixel_r * (1 - food_alpha / 255)
-                )
-                pixel_g = int(
-                    255 * (food_alpha / 255) + pixel_g * (1 - food_alpha / 255)
-                )
-                pixel_b = int(
-                    255 * (food_alpha / 255) + pixel_b * (1 - food_alpha / 255)
-                )
-                pygame.draw.rect(
-                    pheromone_surface,
-                    (pixel_r, pixel_g, pixel_b, 255),
-                    (x_pixel, y_pixel, cell_size, cell_size),
-                )
-    surface.blit(pheromone_surface, (0, 0))
+    global _pheromone_surface
+    if (
+        _pheromone_surface is None
+        or _pheromone_surface.get_size() != surface.get_size()
+    ):
+        _pheromone_surface = pygame.Surface(surface.get_size())
+    # Blend both maps over the whole grid with numpy instead of one
+    # pygame.draw.rect per cell: home pheromone darkens toward (80, 70, 60),
+    # food pheromone lightens toward white, same math as the per-cell loop.
+    # Cells without pheromone come out as the dirt color (160, 82, 45), so
+    # the opaque blit doubles as the background and no screen fill is needed.
+    # Stored values are already quantized to 0..255, so normalization is a
+    # single fixed scalar.
+    home_alpha = home_map.map_vals * np.float32(1.0 / 255.0)
+    food_alpha = food_map.map_vals * np.float32(1.0 / 255.0)
+    pixel_r = 80 * home_alpha + 160 * (1 - home_alpha)
+    pixel_g = 70 * home_alpha + 82 * (1 - home_alpha)
+    pixel_b = 60 * home_alpha + 45 * (1 - home_alpha)
+    pixel_r = 255 * food_alpha + pixel_r * (1 - food_alpha)
+    pixel_g = 255 * food_alpha + pixel_g * (1 - food_alpha)
+    pixel_b = 255 * food_alpha + pixel_b * (1 - food_alpha)
+    rgb = np.stack((pixel_r, pixel_g, pixel_b), axis=-1).astype(np.uint8)
+    # Upscale grid cells to screen pixels and push everything in one blit.
+    rgb = np.repeat(np.repeat(rgb, cell_size, axis=0), cell_size, axis=1)
+    pygame.surfarray.blit_array(_pheromone_surface, rgb.swapaxes(0, 1))
+    surface.blit(_pheromone_surface, (0, 0))
 
 
 def draw_food(surface, food, cell_size=4):
-    for gy in range(food.height):
-        for gx in range(food.width):
-            if food.map_vals[gy, gx]:
-                x_pixel = gx * cell_size
-                y_pixel = gy * cell_size
-                pygame.draw.rect(
-                    surface, (218, 165, 32), (x_pixel, y_pixel, cell_size, cell_size)
-                )
+    # Food only changes on add_food/bite, so the surface is rebuilt just
+    # when the dirty flag is set and blitted as-is on every other frame.
+    if food.surface is None or food.dirty:
+        size = (food.width * cell_size, food.height * cell_size)
+        if food.surface is None or food.surface.get_size() != size:
+            food.surface = pygame.Surface(size)
+            food.surface.set_colorkey((0, 0, 0))
+        rgb = np.where(
+            food.map_vals[:, :, None],
+            np.array((218, 165, 32), dtype=np.uint8),
+            np.zeros(3, dtype=np.uint8),
+        )
+        rgb = np.repeat(np.repeat(rgb, cell_size, axis=0), cell_size, axis=1)
+        pygame.surfarray.blit_array(food.surface, rgb.swapaxes(0, 1))
+        food.dirty = False
+    surface.blit(food.surface, (0, 0))